@@ -272,6 +272,14 @@ class ProviderType(BetterEnum):
     AZURE = 2 #: AZURE
 
 
+class ExecutionModelType(BetterEnum):
+    """How the synchronous endpoints of an Executor are executed."""
+
+    DEFAULT = 0  #: in the default thread pool of the event loop, serialized by the Executor lock unless `allow_concurrent`
+    THREAD = 1  #: in a dedicated, bounded thread pool per endpoint
+    PROCESS = 2  #: in a dedicated, bounded process pool per endpoint, forked from the loaded Executor
+
+
 def replace_enum_to_str(obj):
     """
     Transform BetterEnum type into string.
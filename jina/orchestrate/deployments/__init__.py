@@ -260,8 +260,10 @@ class Deployment(JAMLCompatible, PostMixin, BaseOrchestrator, metaclass=Deployme
         description: Optional[str] = None,
         disable_auto_volume: Optional[bool] = False,
         docker_kwargs: Optional[dict] = None,
+        endpoint_concurrency: Optional[dict] = None,
         entrypoint: Optional[str] = None,
         env: Optional[dict] = None,
+        execution_model: Optional[str] = 'DEFAULT',
         exit_on_exceptions: Optional[List[str]] = [],
         external: Optional[bool] = False,
         floating: Optional[bool] = False,
@@ -335,8 +337,10 @@ class Deployment(JAMLCompatible, PostMixin, BaseOrchestrator, metaclass=Deployme
           container.
 
           More details can be found in the Docker SDK docs:  https://docker-py.readthedocs.io/en/stable/
+        :param endpoint_concurrency: Dictionary mapping endpoints to the maximum number of concurrent calls when `execution-model` is `THREAD` or `PROCESS`. The key `*` sets the value of the endpoints that are not listed. Endpoints default to 1 concurrent call.
         :param entrypoint: The entrypoint command overrides the ENTRYPOINT in Docker image. when not set then the Docker image ENTRYPOINT takes effective.
         :param env: The map of environment variables that are available inside runtime
+        :param execution_model: How the synchronous endpoints of the Executor are executed. `DEFAULT` runs them in the default thread pool of the event loop, one at a time unless `allow-concurrent` is set. `THREAD` runs every endpoint in its own bounded thread pool and `PROCESS` in its own bounded process pool forked from the loaded Executor, where Documents are shipped as serialized bytes. The number of concurrent calls per endpoint is set by `endpoint-concurrency`. Choose from: ['DEFAULT', 'THREAD', 'PROCESS'].
         :param exit_on_exceptions: List of exceptions that will cause the Executor to shut down.
         :param external: The Deployment will be considered an external Deployment that has been started independently from the Flow.This Deployment will not be context managed by the Flow.
         :param floating: If set, the current Pod/Deployment can not be further chained, and the next `.add()` will chain after the last Pod/Deployment not this current one.
@@ -1,5 +1,6 @@
 """Argparser module for WorkerRuntime"""
 
+from jina.enums import ExecutionModelType
 from jina.parsers.helper import KVAppendAction, add_arg_group
 from jina.parsers.orchestrate.runtimes.grpc_channel import (
     mixin_grpc_channel_options_parser,
@@ -124,6 +125,26 @@ Defaults to retaining whatever type is returned by the Executor.
         help='Allow concurrent requests to be processed by the Executor. This is only recommended if the Executor is thread-safe.',
     )
 
+    gp.add_argument(
+        '--execution-model',
+        type=ExecutionModelType.from_string,
+        choices=list(ExecutionModelType),
+        default=ExecutionModelType.DEFAULT,
+        help=f'How the synchronous endpoints of the Executor are executed. `DEFAULT` runs them in the default thread pool of the event loop, '
+        f'one at a time unless `allow-concurrent` is set. `THREAD` runs every endpoint in its own bounded thread pool and `PROCESS` in its own '
+        f'bounded process pool forked from the loaded Executor, where Documents are shipped as serialized bytes. The number of concurrent calls per '
+        f'endpoint is set by `endpoint-concurrency`. Choose from: {[model.to_string() for model in list(ExecutionModelType)]}.',
+    )
+
+    gp.add_argument(
+        '--endpoint-concurrency',
+        action=KVAppendAction,
+        metavar='KEY: VALUE',
+        nargs='*',
+        help='Dictionary mapping endpoints to the maximum number of concurrent calls when `execution-model` is `THREAD` or `PROCESS`. '
+        'The key `*` sets the value of the endpoints that are not listed. Endpoints default to 1 concurrent call.',
+    )
+
     mixin_base_runtime_parser(gp)
     mixin_raft_parser(gp)
     mixin_grpc_channel_options_parser(gp)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import contextlib
 import copy
 import functools
@@ -28,7 +29,7 @@ from typing import (
 
 from jina._docarray import DocumentArray, docarray_v2
 from jina.constants import __args_executor_init__, __cache_path__, __default_endpoint__
-from jina.enums import BetterEnum, ProviderType
+from jina.enums import BetterEnum, ExecutionModelType, ProviderType
 from jina.helper import (
     ArgNamespace,
     T,
@@ -330,6 +331,191 @@ class _FunctionWithSchema(NamedTuple):
         return fn_with_schema
 
 
+def _parameters_as_pydantic_models_decorator(func, parameters_pydantic_model):
+    # Decorator to make sure that `parameters` are passed as PydanticModels if needed
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        parameters = kwargs.get('parameters', None)
+        if parameters is not None:
+            parameters = parameters_pydantic_model(**parameters)
+            kwargs['parameters'] = parameters
+        result = func(*args, **kwargs)
+        return result
+
+    return wrapper
+
+
+def _loop_docs_decorator(func, response_schema):
+    # Decorator to make sure that `docs` are fed one by one to method using singleton document serving
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        docs = kwargs.pop('docs')
+        if docarray_v2:
+            from docarray import DocList
+
+            ret = DocList[response_schema]()
+        else:
+            ret = DocumentArray()
+        for doc in docs:
+            f_ret = func(*args, doc=doc, **kwargs)
+            if f_ret is None:
+                ret.append(doc)  # this means change in place
+            else:
+                ret.append(f_ret)
+        return ret
+
+    return wrapper
+
+
+def _async_loop_docs_decorator(func, response_schema):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        docs = kwargs.pop('docs')
+        if docarray_v2:
+            from docarray import DocList
+
+            ret = DocList[response_schema]()
+        else:
+            ret = DocumentArray()
+        for doc in docs:
+            f_ret = await func(*args, doc=doc, **kwargs)
+            if f_ret is None:
+                ret.append(doc)  # this means change in place
+            else:
+                ret.append(f_ret)
+        return ret
+
+    return wrapper
+
+
+# the Executor that the calls submitted to a process pool run against, set once in every forked worker process
+_process_pool_executor: Optional['BaseExecutor'] = None
+
+
+def _set_process_pool_executor(executor: 'BaseExecutor'):
+    global _process_pool_executor
+    _process_pool_executor = executor
+
+
+def _docs_cls(schema):
+    if docarray_v2:
+        from docarray import DocList
+
+        return DocList[schema]
+    return DocumentArray
+
+
+def _call_endpoint_in_process(
+    req_endpoint: str, docs_bytes, docs_matrix_bytes, docs_map_bytes, kwargs
+):
+    # Runs in a worker process of a process pool: Documents travel as bytes in both directions. Besides the result of
+    # the endpoint, the Documents are sent back so that changes done in place are not lost
+    executor = _process_pool_executor
+    plan = executor._get_dispatch_plan(req_endpoint)
+    request_cls = _docs_cls(plan.fn_info.request_schema)
+    docs = request_cls.from_bytes(docs_bytes) if docs_bytes is not None else None
+    if docs_matrix_bytes is not None:
+        kwargs['docs_matrix'] = [request_cls.from_bytes(b) for b in docs_matrix_bytes]
+    if docs_map_bytes is not None:
+        kwargs['docs_map'] = {
+            k: request_cls.from_bytes(b) for k, b in docs_map_bytes.items()
+        }
+    ret = plan.func(executor, docs=docs, tracing_context=None, **kwargs)
+    if isinstance(ret, DocumentArray):
+        return ret.to_bytes(), True, None
+    return ret, False, docs.to_bytes() if docs is not None else None
+
+
+async def _call_endpoint_in_process_pool(
+    pool: concurrent.futures.ProcessPoolExecutor,
+    plan: '_EndpointDispatchPlan',
+    req_endpoint: str,
+    kwargs: Dict,
+):
+    docs = kwargs.pop('docs', None)
+    docs_matrix = kwargs.pop('docs_matrix', None)
+    docs_map = kwargs.pop('docs_map', None)
+    ret, ret_is_docs, docs_bytes = await get_or_reuse_loop().run_in_executor(
+        pool,
+        _call_endpoint_in_process,
+        req_endpoint,
+        docs.to_bytes() if docs is not None else None,
+        [d.to_bytes() for d in docs_matrix] if docs_matrix is not None else None,
+        {k: d.to_bytes() for k, d in docs_map.items()}
+        if docs_map is not None
+        else None,
+        kwargs,
+    )
+    if ret_is_docs:
+        return _docs_cls(plan.fn_info.response_schema).from_bytes(ret)
+    if docs_bytes is not None:
+        docs.clear()
+        docs.extend(_docs_cls(plan.fn_info.request_schema).from_bytes(docs_bytes))
+    return ret
+
+
+class _EndpointDispatchPlan(NamedTuple):
+    """Everything needed to call an endpoint that does not depend on the request, computed once per endpoint."""
+
+    fn_info: _FunctionWithSchema
+    func: Callable
+    is_coroutine: bool
+    loop_docs_func: Callable
+    is_loop_docs_coroutine: bool
+    summary: Optional[Any]
+    histogram_metric_labels: Dict[str, Optional[str]]
+    pool: Optional[concurrent.futures.Executor]
+
+    @staticmethod
+    def build(
+        executor: 'BaseExecutor', req_endpoint: str, fn_info: _FunctionWithSchema
+    ) -> '_EndpointDispatchPlan':
+        original_func = fn_info.fn
+        if iscoroutinefunction(original_func):
+            loop_docs_func = _async_loop_docs_decorator(
+                original_func, fn_info.response_schema
+            )
+        else:
+            loop_docs_func = _loop_docs_decorator(
+                original_func, fn_info.response_schema
+            )
+        func = original_func
+        if fn_info.parameters_is_pydantic_model:
+            func = _parameters_as_pydantic_models_decorator(
+                func, fn_info.parameters_model
+            )
+            loop_docs_func = _parameters_as_pydantic_models_decorator(
+                loop_docs_func, fn_info.parameters_model
+            )
+
+        runtime_name = (
+            executor.runtime_args.name
+            if hasattr(executor.runtime_args, 'name')
+            else None
+        )
+        summary = (
+            executor._summary_method.labels(
+                executor.__class__.__name__, req_endpoint, runtime_name
+            )
+            if executor._summary_method
+            else None
+        )
+        return _EndpointDispatchPlan(
+            fn_info=fn_info,
+            func=func,
+            is_coroutine=iscoroutinefunction(func),
+            loop_docs_func=loop_docs_func,
+            is_loop_docs_coroutine=iscoroutinefunction(loop_docs_func),
+            summary=summary,
+            histogram_metric_labels={
+                'executor': executor.__class__.__name__,
+                'executor_endpoint': req_endpoint,
+                'runtime_name': runtime_name,
+            },
+            pool=executor._get_endpoint_pool(req_endpoint, fn_info),
+        )
+
+
 class BaseExecutor(JAMLCompatible, metaclass=ExecutorType):
     """
     The base class of all Executors, can be used to build encoder, indexer, etc.
@@ -430,6 +616,7 @@ class BaseExecutor(JAMLCompatible, metaclass=ExecutorType):
         self._write_lock = (
             threading.Lock()
         )  # watch because this makes it no serializable
+        self._build_dispatch_plans()
 
     def _get_endpoint_models_dict(self):
         from jina._docarray import docarray_v2
@@ -763,90 +950,118 @@ class BaseExecutor(JAMLCompatible, metaclass=ExecutorType):
         elif __default_endpoint__ in self.requests:
             return await self.__acall_endpoint__(__default_endpoint__, **kwargs)
 
-    async def __acall_endpoint__(
-        self, req_endpoint, tracing_context: Optional['Context'], **kwargs
-    ):
-        # Decorator to make sure that `parameters` are passed as PydanticModels if needed
-        def parameters_as_pydantic_models_decorator(func, parameters_pydantic_model):
-            @functools.wraps(func)  # Step 2: Use functools.wraps to preserve metadata
-            def wrapper(*args, **kwargs):
-                parameters = kwargs.get('parameters', None)
-                if parameters is not None:
-                    parameters = parameters_pydantic_model(**parameters)
-                    kwargs['parameters'] = parameters
-                result = func(*args, **kwargs)
-                return result
-
-            return wrapper
-
-        # Decorator to make sure that `docs` are fed one by one to method using singleton document serving
-        def loop_docs_decorator(func):
-            @functools.wraps(func)  # Step 2: Use functools.wraps to preserve metadata
-            def wrapper(*args, **kwargs):
-                docs = kwargs.pop('docs')
-                if docarray_v2:
-                    from docarray import DocList
-
-                    ret = DocList[response_schema]()
-                else:
-                    ret = DocumentArray()
-                for doc in docs:
-                    f_ret = func(*args, doc=doc, **kwargs)
-                    if f_ret is None:
-                        ret.append(doc)  # this means change in place
-                    else:
-                        ret.append(f_ret)
-                return ret
-
-            return wrapper
-
-        def async_loop_docs_decorator(func):
-            @functools.wraps(func)  # Step 2: Use functools.wraps to preserve metadata
-            async def wrapper(*args, **kwargs):
-                docs = kwargs.pop('docs')
-                if docarray_v2:
-                    from docarray import DocList
-
-                    ret = DocList[response_schema]()
-                else:
-                    ret = DocumentArray()
-                for doc in docs:
-                    f_ret = await original_func(*args, doc=doc, **kwargs)
-                    if f_ret is None:
-                        ret.append(doc)  # this means change in place
-                    else:
-                        ret.append(f_ret)
-                return ret
-
-            return wrapper
+    def _get_dispatch_plan(self, req_endpoint: str) -> '_EndpointDispatchPlan':
+        """Get the dispatch plan of an endpoint, (re)building it if the endpoint function changed since it was built.
 
+        :param req_endpoint: the endpoint to dispatch to
+        :return: the dispatch plan of the endpoint
+        """
         fn_info = self.requests[req_endpoint]
-        original_func = fn_info.fn
-        is_generator = fn_info.is_generator
-        is_batch_docs = fn_info.is_batch_docs
-        response_schema = fn_info.response_schema
-        parameters_model = fn_info.parameters_model
-        is_parameters_pydantic_model = fn_info.parameters_is_pydantic_model
+        plans = self.__dict__.setdefault('_dispatch_plans', {})
+        plan = plans.get(req_endpoint, None)
+        if plan is None or plan.fn_info is not fn_info:
+            plan = _EndpointDispatchPlan.build(self, req_endpoint, fn_info)
+            plans[req_endpoint] = plan
+        return plan
+
+    def _get_endpoint_pool(
+        self, req_endpoint: str, fn_info: _FunctionWithSchema
+    ) -> Optional[concurrent.futures.Executor]:
+        """Get the pool that runs a synchronous endpoint, creating it on first use. None means the default thread pool
+        of the event loop, guarded by the Executor lock.
+
+        :param req_endpoint: the endpoint to run
+        :param fn_info: the function of the endpoint
+        :return: the pool of the endpoint, if any
+        """
+        execution_model = getattr(
+            self.runtime_args, 'execution_model', ExecutionModelType.DEFAULT
+        )
+        if isinstance(execution_model, str):
+            execution_model = ExecutionModelType.from_string(execution_model)
+        if (
+            execution_model == ExecutionModelType.DEFAULT
+            or req_endpoint == __dry_run_endpoint__
+            or iscoroutinefunction(fn_info.fn)
+        ):
+            return None
+        pools = self.__dict__.setdefault('_endpoint_pools', {})
+        pool = pools.get(req_endpoint, None)
+        if pool is None:
+            endpoint_concurrency = (
+                getattr(self.runtime_args, 'endpoint_concurrency', None) or {}
+            )
+            max_workers = int(
+                endpoint_concurrency.get(
+                    req_endpoint, endpoint_concurrency.get('*', 1)
+                )
+            )
+            # only endpoints receiving and returning whole batches of Documents can ship them to another process
+            if (
+                execution_model == ExecutionModelType.PROCESS
+                and fn_info.is_batch_docs
+                and not fn_info.is_generator
+            ):
+                pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context('fork'),
+                    initializer=_set_process_pool_executor,
+                    initargs=(self,),
+                )
+            else:
+                pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix=f'{self.__class__.__name__}{req_endpoint}',
+                )
+            pools[req_endpoint] = pool
+        return pool
+
+    def _close_endpoint_pools(self):
+        """Shut down the pools of the endpoints, cancelling the calls that did not start yet."""
+        pools = self.__dict__.get('_endpoint_pools', {})
+        for pool in pools.values():
+            pool.shutdown(wait=True, cancel_futures=True)
+        pools.clear()
+
+    def _build_dispatch_plans(self):
+        """Build the dispatch plans of every endpoint, so that no request pays for building them."""
+        # forked worker processes hold the previous code of the Executor, they are recreated on demand
+        self._close_endpoint_pools()
+        self._dispatch_plans = {}
+        for req_endpoint in self.requests.keys():
+            self._get_dispatch_plan(req_endpoint)
 
-        func = original_func
-        if is_generator or is_batch_docs:
-            pass
+    async def __acall_endpoint__(
+        self, req_endpoint, tracing_context: Optional['Context'], **kwargs
+    ):
+        plan = self._get_dispatch_plan(req_endpoint)
+        if plan.fn_info.is_generator or plan.fn_info.is_batch_docs:
+            func, is_coroutine = plan.func, plan.is_coroutine
         elif kwargs.get('docs', None) is not None:
             # This means I need to pass every doc (most likely 1, but potentially more)
-            if iscoroutinefunction(original_func):
-                func = async_loop_docs_decorator(original_func)
-            else:
-                func = loop_docs_decorator(original_func)
-
-        if is_parameters_pydantic_model:
-            func = parameters_as_pydantic_models_decorator(func, parameters_model)
+            func, is_coroutine = plan.loop_docs_func, plan.is_loop_docs_coroutine
+        else:
+            func, is_coroutine = plan.func, plan.is_coroutine
 
-        async def exec_func(
-            summary, histogram, histogram_metric_labels, tracing_context
-        ):
-            with MetricsTimer(summary, histogram, histogram_metric_labels):
-                if iscoroutinefunction(func):
+        async def exec_func(tracing_context):
+            with MetricsTimer(
+                plan.summary,
+                self._process_request_histogram,
+                plan.histogram_metric_labels,
+            ):
+                if is_coroutine:
                     return await func(self, tracing_context=tracing_context, **kwargs)
+                elif isinstance(plan.pool, concurrent.futures.ProcessPoolExecutor):
+                    return await _call_endpoint_in_process_pool(
+                        plan.pool, plan, req_endpoint, kwargs
+                    )
+                elif plan.pool is not None:
+                    return await get_or_reuse_loop().run_in_executor(
+                        plan.pool,
+                        functools.partial(
+                            func, self, tracing_context=tracing_context, **kwargs
+                        ),
+                    )
                 else:
                     async with self._lock:
                         return await get_or_reuse_loop().run_in_executor(
@@ -856,23 +1071,6 @@ class BaseExecutor(JAMLCompatible, metaclass=ExecutorType):
                             ),
                         )
 
-        runtime_name = (
-            self.runtime_args.name if hasattr(self.runtime_args, 'name') else None
-        )
-
-        _summary = (
-            self._summary_method.labels(
-                self.__class__.__name__, req_endpoint, runtime_name
-            )
-            if self._summary_method
-            else None
-        )
-        _histogram_metric_labels = {
-            'executor': self.__class__.__name__,
-            'executor_endpoint': req_endpoint,
-            'runtime_name': runtime_name,
-        }
-
         if self.tracer:
             with self.tracer.start_as_current_span(
                 req_endpoint, context=tracing_context
@@ -884,19 +1082,9 @@ class BaseExecutor(JAMLCompatible, metaclass=ExecutorType):
 
                 tracing_carrier_context = {}
                 TraceContextTextMapPropagator().inject(tracing_carrier_context)
-                return await exec_func(
-                    _summary,
-                    self._process_request_histogram,
-                    _histogram_metric_labels,
-                    extract(tracing_carrier_context),
-                )
+                return await exec_func(extract(tracing_carrier_context))
         else:
-            return await exec_func(
-                _summary,
-                self._process_request_histogram,
-                _histogram_metric_labels,
-                None,
-            )
+            return await exec_func(None)
 
     @property
     def workspace(self) -> Optional[str]:
@@ -1000,8 +1188,10 @@ class BaseExecutor(JAMLCompatible, metaclass=ExecutorType):
         description: Optional[str] = None,
         disable_auto_volume: Optional[bool] = False,
         docker_kwargs: Optional[dict] = None,
+        endpoint_concurrency: Optional[dict] = None,
         entrypoint: Optional[str] = None,
         env: Optional[dict] = None,
+        execution_model: Optional[str] = 'DEFAULT',
         exit_on_exceptions: Optional[List[str]] = [],
         external: Optional[bool] = False,
         floating: Optional[bool] = False,
@@ -1075,8 +1265,10 @@ class BaseExecutor(JAMLCompatible, metaclass=ExecutorType):
           container.
 
           More details can be found in the Docker SDK docs:  https://docker-py.readthedocs.io/en/stable/
+        :param endpoint_concurrency: Dictionary mapping endpoints to the maximum number of concurrent calls when `execution-model` is `THREAD` or `PROCESS`. The key `*` sets the value of the endpoints that are not listed. Endpoints default to 1 concurrent call.
         :param entrypoint: The entrypoint command overrides the ENTRYPOINT in Docker image. when not set then the Docker image ENTRYPOINT takes effective.
         :param env: The map of environment variables that are available inside runtime
+        :param execution_model: How the synchronous endpoints of the Executor are executed. `DEFAULT` runs them in the default thread pool of the event loop, one at a time unless `allow-concurrent` is set. `THREAD` runs every endpoint in its own bounded thread pool and `PROCESS` in its own bounded process pool forked from the loaded Executor, where Documents are shipped as serialized bytes. The number of concurrent calls per endpoint is set by `endpoint-concurrency`. Choose from: ['DEFAULT', 'THREAD', 'PROCESS'].
         :param exit_on_exceptions: List of exceptions that will cause the Executor to shut down.
         :param external: The Deployment will be considered an external Deployment that has been started independently from the Flow.This Deployment will not be context managed by the Flow.
         :param floating: If set, the current Pod/Deployment can not be further chained, and the next `.add()` will chain after the last Pod/Deployment not this current one.
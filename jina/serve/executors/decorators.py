@@ -420,6 +420,9 @@ def dynamic_batching(
     custom_metric: Optional[Callable[['DocumentArray'], Union[float, int]]] = None,
     use_custom_metric: bool = False,
     use_dynamic_batching: bool = True,
+    stack_tensors: bool = False,
+    latency_slo: Optional[float] = None,
+    max_inflight_batches: Optional[int] = None,
 ):
     """
     `@dynamic_batching` defines the dynamic batching behavior of an Executor.
@@ -440,6 +443,15 @@ def dynamic_batching(
     :param custom_metric: Potential lambda function to measure the "weight" of each request.
     :param use_custom_metric: Determines if we need to use the `custom_metric` to determine preferred_batch_size.
     :param use_dynamic_batching: Determines if we should apply dynamic batching for this method.
+    :param stack_tensors: Determines if the `embedding` and `tensor` fields of the batched Documents are copied into one contiguous buffer per batch.
+        Every Document then holds a view into this buffer, so stacking them in the Executor and splitting the results back
+        per request does not require per-Document copies.
+    :param latency_slo: target p99 latency in milliseconds. If set, the batch size and timeout are tuned online from the observed
+        execution time and arrival rate, with `preferred_batch_size` and `timeout` acting as upper bounds. Not applied when `use_custom_metric` is True.
+    :param max_inflight_batches: maximum number of batches of this endpoint executed at the same time. If set, batches are pipelined:
+        the next batch accumulates and executes while the results of the previous one are assigned to their requests, and new requests
+        are held back while more than `preferred_batch_size * (max_inflight_batches + 1)` Documents are pending.
+        Synchronous methods only execute concurrently if the Executor allows concurrent calls.
     :return: decorated function
     """
 
@@ -489,6 +501,9 @@ def dynamic_batching(
             owner.dynamic_batching[fn_name]['use_custom_metric'] = use_custom_metric
             owner.dynamic_batching[fn_name]['custom_metric'] = custom_metric
             owner.dynamic_batching[fn_name]['use_dynamic_batching'] = use_dynamic_batching
+            owner.dynamic_batching[fn_name]['stack_tensors'] = stack_tensors
+            owner.dynamic_batching[fn_name]['latency_slo'] = latency_slo
+            owner.dynamic_batching[fn_name]['max_inflight_batches'] = max_inflight_batches
             setattr(owner, name, self.fn)
 
         def __set_name__(self, owner, name):
@@ -1,5 +1,4 @@
 import asyncio
-import copy
 from typing import TYPE_CHECKING, AsyncGenerator, Callable, List, Optional, Tuple, Type
 
 import grpc.aio
@@ -54,11 +53,11 @@ class AsyncRequestResponseHandler(MonitoringRequestMixin):
         :return: Return a Function that given a Request will return a Future from where to extract the response
         """
 
-        async def gather_endpoints(request_graph):
+        async def gather_endpoints():
             if not self._endpoint_discovery_finished:
                 self._gathering_endpoints = True
                 try:
-                    _ = await request_graph._get_all_endpoints(connection_pool)
+                    _ = await graph._get_all_endpoints(connection_pool)
                 except InternalNetworkError as err:
                     err_code = err.code()
                     if err_code == grpc.StatusCode.UNAVAILABLE:
@@ -78,8 +77,8 @@ class AsyncRequestResponseHandler(MonitoringRequestMixin):
             request: 'Request', return_type: Type[DocumentArray]
         ) -> 'Tuple[Future, Optional[Future]]':
             self._update_start_request_metrics(request)
-            # important that the gateway needs to have an instance of the graph per request
-            request_graph = copy.deepcopy(graph)
+            # the graph is shared by all the requests, the state of this request in the graph is kept in its own context
+            request_context = graph.create_request_context()
             responding_tasks = []
             floating_tasks = []
             endpoint = request.header.exec_endpoint
@@ -88,7 +87,7 @@ class AsyncRequestResponseHandler(MonitoringRequestMixin):
             r.start_time.GetCurrentTime()
             # If the request is targeting a specific deployment, we can send directly to the deployment instead of
             # querying the graph
-            num_outgoing_nodes = len(request_graph.origin_nodes)
+            num_outgoing_nodes = len(graph.origin_nodes)
             has_specific_params = False
             request_input_parameters = request.parameters
             for key in request_input_parameters:
@@ -102,9 +101,7 @@ class AsyncRequestResponseHandler(MonitoringRequestMixin):
             exec_endpoint = request.header.exec_endpoint
             gather_endpoints_task = None
             if not self._endpoint_discovery_finished and not self._gathering_endpoints:
-                gather_endpoints_task = asyncio.create_task(
-                    gather_endpoints(request_graph)
-                )
+                gather_endpoints_task = asyncio.create_task(gather_endpoints())
 
             init_task = None
             request_doc_ids = []
@@ -127,7 +124,7 @@ class AsyncRequestResponseHandler(MonitoringRequestMixin):
             else:
                 init_task = None
 
-            for origin_node in request_graph.origin_nodes:
+            for origin_node in graph.origin_nodes:
                 leaf_tasks = origin_node.get_leaf_req_response_tasks(
                     connection_pool=connection_pool,
                     request_to_send=request,
@@ -139,6 +136,7 @@ class AsyncRequestResponseHandler(MonitoringRequestMixin):
                     copy_request_at_send=num_outgoing_nodes > 1 and has_specific_params,
                     init_task=init_task,
                     return_type=return_type,
+                    request_context=request_context,
                 )
                 # Every origin node returns a set of tasks that are the ones corresponding to the leafs of each of their
                 # subtrees that unwrap all the previous tasks. It starts like a chain of waiting for tasks from previous
@@ -158,7 +156,8 @@ class AsyncRequestResponseHandler(MonitoringRequestMixin):
                 response.data.docs = DocumentArray(sorted_docs)
 
             async def _process_results_at_end_gateway(
-                tasks: List[asyncio.Task], request_graph: TopologyGraph
+                tasks: List[asyncio.Task],
+                request_context: TopologyGraph._RequestContext,
             ) -> asyncio.Future:
                 try:
                     partial_responses = await asyncio.gather(*tasks)
@@ -178,12 +177,12 @@ class AsyncRequestResponseHandler(MonitoringRequestMixin):
                 for i in reversed(range(len(response.routes))):
                     if response.routes[i].executor != GATEWAY_NAME:
                         del response.routes[i]
-                request_graph.add_routes(response)
+                graph.add_routes(response, request_context)
 
                 if graph.has_filter_conditions:
                     _sort_response_docs(response)
 
-                collect_results = request_graph.collect_all_results()
+                collect_results = graph.collect_all_results(request_context)
                 resp_params = response.parameters
                 if len(collect_results) > 0:
                     resp_params[WorkerRequestHandler._KEY_RESULT] = collect_results
@@ -199,7 +198,7 @@ class AsyncRequestResponseHandler(MonitoringRequestMixin):
 
             return (
                 asyncio.ensure_future(
-                    _process_results_at_end_gateway(responding_tasks, request_graph)
+                    _process_results_at_end_gateway(responding_tasks, request_context)
                 ),
                 (
                     asyncio.ensure_future(asyncio.gather(*floating_tasks))
@@ -225,8 +224,6 @@ class AsyncRequestResponseHandler(MonitoringRequestMixin):
             request: 'Request', return_type: Type[DocumentArray] = DocumentArray
         ) -> 'Tuple[Future, Optional[Future]]':
             self._update_start_request_metrics(request)
-            # important that the gateway needs to have an instance of the graph per request
-            request_graph = copy.deepcopy(graph)
             r = request.routes.add()
             r.executor = 'gateway'
             r.start_time.GetCurrentTime()
@@ -235,7 +232,7 @@ class AsyncRequestResponseHandler(MonitoringRequestMixin):
             # reset it in case we send to an external gateway
             exec_endpoint = request.header.exec_endpoint
 
-            node = request_graph.all_nodes[
+            node = graph.all_nodes[
                 0
             ]  # this assumes there is only one Executor behind this Gateway
             async for resp in node.stream_single_doc(
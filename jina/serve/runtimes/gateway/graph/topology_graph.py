@@ -36,8 +36,60 @@ class TopologyGraph:
 
     :param conditions: A dictionary describing which Executors have special conditions to be fullfilled by the `Documents` to be sent to them.
     :param reduce: Reduce requests arriving from multiple needed predecessors, True by default
+
+    .. note::
+        The graph and its nodes are shared by all the requests, and are not modified while serving them. The state of
+        a request as it flows through the graph is kept in a :class:`_RequestContext` created for every request.
     """
 
+    class _NodeState:
+        """The state of a single request at a node of the graph"""
+
+        __slots__ = (
+            'parts_to_send',
+            'start_time',
+            'end_time',
+            'status',
+            'result_in_params_returned',
+        )
+
+        def __init__(self):
+            self.parts_to_send = []
+            self.start_time = None
+            self.end_time = None
+            self.status = None
+            self.result_in_params_returned = None
+
+    class _RequestContext:
+        """The state of a single request as it flows through the graph, with one :class:`_NodeState` per node"""
+
+        __slots__ = ('_node_states',)
+
+        def __init__(self):
+            self._node_states = {}
+
+        def node_state(self, node_name: str) -> 'TopologyGraph._NodeState':
+            """
+            Get the state of the request at a node, creating it the first time the request reaches the node
+
+            :param node_name: the name of the node
+            :return: the state of the request at the node
+            """
+            state = self._node_states.get(node_name, None)
+            if state is None:
+                state = TopologyGraph._NodeState()
+                self._node_states[node_name] = state
+            return state
+
+        def get_node_state(self, node_name: str) -> Optional['TopologyGraph._NodeState']:
+            """
+            Get the state of the request at a node, if the request reached the node
+
+            :param node_name: the name of the node
+            :return: the state of the request at the node, or None
+            """
+            return self._node_states.get(node_name, None)
+
     class _ReqReplyNode:
         def __init__(
             self,
@@ -55,16 +107,11 @@ class TopologyGraph:
             self.outgoing_nodes = []
             self.number_of_parts = number_of_parts
             self.floating = floating
-            self.parts_to_send = []
-            self.start_time = None
-            self.end_time = None
-            self.status = None
             self._filter_condition = filter_condition
             self._metadata = metadata
             self._reduce = reduce
             self._timeout_send = timeout_send
             self._retries = retries
-            self.result_in_params_returned = None
             self.logger = logger or JinaLogger(self.__class__.__name__)
             self.endpoints = None
             self._pydantic_models_by_endpoint = None
@@ -143,13 +190,13 @@ class TopologyGraph:
                 return node._validate_against_outgoing_nodes()
             return True
 
-        def _update_requests_with_filter_condition(self, need_copy):
-            for i in range(len(self.parts_to_send)):
-                doc_array_cls = self.parts_to_send[i].document_array_cls
+        def _update_requests_with_filter_condition(self, parts_to_send, need_copy):
+            for i in range(len(parts_to_send)):
+                doc_array_cls = parts_to_send[i].document_array_cls
                 req = (
-                    self.parts_to_send[i]
+                    parts_to_send[i]
                     if not need_copy
-                    else copy.deepcopy(self.parts_to_send[i])
+                    else copy.deepcopy(parts_to_send[i])
                 )
                 # somehow the document_array_cls is not copied
                 req.document_array_cls = doc_array_cls
@@ -160,16 +207,16 @@ class TopologyGraph:
 
                     filtered_docs = filter_docs(req.docs, self._filter_condition)
                 req.data.docs = filtered_docs
-                self.parts_to_send[i] = req
+                parts_to_send[i] = req
 
         def _update_request_by_params(
-            self, deployment_name: str, request_input_parameters: Dict
+            self, parts_to_send, deployment_name: str, request_input_parameters: Dict
         ):
             specific_parameters = _parse_specific_params(
                 request_input_parameters, deployment_name
             )
-            for i in range(len(self.parts_to_send)):
-                self.parts_to_send[i].parameters = specific_parameters
+            for i in range(len(parts_to_send)):
+                parts_to_send[i].parameters = specific_parameters
 
         def _handle_internalnetworkerror(self, err):
             err_code = err.code()
@@ -392,8 +439,10 @@ class TopologyGraph:
             copy_request_at_send: bool = False,
             init_task: Optional[asyncio.Task] = None,
             return_type: Type[DocumentArray] = None,
+            request_context: Optional['TopologyGraph._RequestContext'] = None,
         ):
             # Check my condition and send request with the condition
+            state = request_context.node_state(self.name)
             metadata = {}
             if init_task is not None:
                 await init_task
@@ -416,14 +465,16 @@ class TopologyGraph:
                             self._pydantic_models_by_endpoint[endpoint]['input']
                         ]
 
-                self.parts_to_send.append(req_to_send)
+                state.parts_to_send.append(req_to_send)
                 # this is a specific needs
-                if len(self.parts_to_send) == self.number_of_parts:
-                    self.start_time = datetime.utcnow()
-                    self._update_request_by_params(self.name, request_input_parameters)
+                if len(state.parts_to_send) == self.number_of_parts:
+                    state.start_time = datetime.utcnow()
+                    self._update_request_by_params(
+                        state.parts_to_send, self.name, request_input_parameters
+                    )
                     if self._filter_condition is not None:
                         self._update_requests_with_filter_condition(
-                            need_copy=not copy_request_at_send
+                            state.parts_to_send, need_copy=not copy_request_at_send
                         )
 
                     # avoid sending to executor which does not bind to this endpoint
@@ -434,9 +485,9 @@ class TopologyGraph:
                         ):
                             return request, metadata
 
-                    if self._reduce and len(self.parts_to_send) > 1:
-                        self.parts_to_send = [
-                            WorkerRequestHandler.reduce_requests(self.parts_to_send)
+                    if self._reduce and len(state.parts_to_send) > 1:
+                        state.parts_to_send = [
+                            WorkerRequestHandler.reduce_requests(state.parts_to_send)
                         ]
 
                     if target_executor_pattern is not None and not re.match(
@@ -446,7 +497,7 @@ class TopologyGraph:
                     # otherwise, send to executor and get response
                     try:
                         result = await connection_pool.send_requests_once(
-                            requests=self.parts_to_send,
+                            requests=state.parts_to_send,
                             deployment=self.name,
                             metadata=self._metadata,
                             head=True,
@@ -487,12 +538,12 @@ class TopologyGraph:
 
                         if WorkerRequestHandler._KEY_RESULT in resp.parameters:
                             # Accumulate results from each Node and then add them to the original
-                            self.result_in_params_returned = resp.parameters[
+                            state.result_in_params_returned = resp.parameters[
                                 WorkerRequestHandler._KEY_RESULT
                             ]
                         request.parameters = request_input_parameters
                         resp.parameters = request_input_parameters
-                        self.parts_to_send.clear()
+                        state.parts_to_send.clear()
                     except InternalNetworkError as err:
                         self._handle_internalnetworkerror(err)
                     except Exception as err:
@@ -501,9 +552,9 @@ class TopologyGraph:
                         )
                         raise err
 
-                    self.end_time = datetime.utcnow()
+                    state.end_time = datetime.utcnow()
                     if metadata and 'is-error' in metadata:
-                        self.status = resp.header.status
+                        state.status = resp.header.status
                     return resp, metadata
 
             return None, {}
@@ -630,6 +681,7 @@ class TopologyGraph:
             copy_request_at_send: bool = False,
             init_task: Optional[asyncio.Task] = None,
             return_type: Type[DocumentArray] = DocumentArray,
+            request_context: Optional['TopologyGraph._RequestContext'] = None,
         ) -> List[Tuple[bool, asyncio.Task]]:
             """
             Gets all the tasks corresponding from all the subgraphs born from this node
@@ -663,10 +715,13 @@ class TopologyGraph:
                 When the caller of these methods await them, they will fire the logic of sending requests and responses from and to every deployment
 
             :param return_type: the DocumentArray type to be returned. By default, it is `DocumentArray`.
+            :param request_context: The state of the request in the graph, shared by all the nodes it flows through. A new one is created if not given
             :return: Return a list of tuples, where tasks corresponding to the leafs of all the subgraphs born from this node are in each tuple.
                 These tasks will be based on awaiting for the task from previous_node and sending a request to the corresponding node. The other member of the pair
                 is a flag indicating if the task is to be awaited by the gateway or not.
             """
+            if request_context is None:
+                request_context = TopologyGraph._RequestContext()
             wait_previous_and_send_task = asyncio.create_task(
                 self._wait_previous_and_send(
                     request=request_to_send,
@@ -678,6 +733,7 @@ class TopologyGraph:
                     copy_request_at_send=copy_request_at_send,
                     init_task=init_task,
                     return_type=return_type,
+                    request_context=request_context,
                 )
             )
             if self.leaf:  # I am like a leaf
@@ -698,17 +754,23 @@ class TopologyGraph:
                     copy_request_at_send=num_outgoing_nodes > 1
                     and request_input_has_specific_params,
                     return_type=return_type,
+                    request_context=request_context,
                 )
                 # We are interested in the last one, that will be the task that awaits all the previous
                 hanging_tasks_tuples.extend(t)
 
             return hanging_tasks_tuples
 
-        def add_route(self, request: 'DataRequest'):
+        def add_route(
+            self,
+            request: 'DataRequest',
+            request_context: 'TopologyGraph._RequestContext',
+        ):
             """
              Add routes to the DataRequest based on the state of request processing
 
              :param request: the request to add the routes to
+             :param request_context: the state of the request in the graph
             :return: modified request with added routes
             """
 
@@ -718,17 +780,20 @@ class TopologyGraph:
                         return r
                 return None
 
+            state = request_context.get_node_state(self.name)
             r = _find_route(request)
-            if r is None and self.start_time:
+            if r is None and state is not None and state.start_time:
                 r = request.routes.add()
                 r.executor = self.name
-                r.start_time.FromDatetime(self.start_time)
-                if self.end_time:
-                    r.end_time.FromDatetime(self.end_time)
-                if self.status:
-                    r.status.CopyFrom(self.status)
+                r.start_time.FromDatetime(state.start_time)
+                if state.end_time:
+                    r.end_time.FromDatetime(state.end_time)
+                if state.status:
+                    r.status.CopyFrom(state.status)
             for outgoing_node in self.outgoing_nodes:
-                request = outgoing_node.add_route(request=request)
+                request = outgoing_node.add_route(
+                    request=request, request_context=request_context
+                )
             return request
 
     class _EndGatewayNode(_ReqReplyNode):
@@ -835,6 +900,16 @@ class TopologyGraph:
         self._origin_nodes = [nodes[node_name] for node_name in origin_node_names]
         self.has_filter_conditions = bool(graph_conditions)
         self._all_endpoints = None
+        self._all_nodes = None
+
+    def create_request_context(self) -> '_RequestContext':
+        """
+        Create the object holding the state of a new request as it flows through the graph. The graph itself is shared by
+        all the requests.
+
+        :return: a new request context
+        """
+        return TopologyGraph._RequestContext()
 
     async def _get_all_endpoints(
         self, connection_pool, retry_forever=False, is_cancel=None
@@ -876,15 +951,16 @@ class TopologyGraph:
 
         return self._all_endpoints
 
-    def add_routes(self, request: 'DataRequest'):
+    def add_routes(self, request: 'DataRequest', request_context: '_RequestContext'):
         """
         Add routes to the DataRequest based on the state of request processing
 
         :param request: the request to add the routes to
+        :param request_context: the state of the request in the graph
         :return: modified request with added routes
         """
         for node in self._origin_nodes:
-            request = node.add_route(request=request)
+            request = node.add_route(request=request, request_context=request_context)
         return request
 
     @property
@@ -904,6 +980,8 @@ class TopologyGraph:
 
         :return: A list of nodes
         """
+        if self._all_nodes is not None:
+            return self._all_nodes
 
         def _get_all_nodes(node, accum, accum_names):
             if node.name not in accum_names:
@@ -921,17 +999,20 @@ class TopologyGraph:
                 if st_node_name not in node_names:
                     nodes.append(st_node)
                     node_names.append(st_node_name)
+        self._all_nodes = nodes
         return nodes
 
-    def collect_all_results(self):
+    def collect_all_results(self, request_context: '_RequestContext'):
         """Collect all the results from every node into a single dictionary so that gateway can collect them
 
+        :param request_context: the state of the request in the graph
         :return: A dictionary of the results
         """
         res = {}
         for node in self.all_nodes:
-            if node.result_in_params_returned:
-                res.update(node.result_in_params_returned)
+            state = request_context.get_node_state(node.name)
+            if state is not None and state.result_in_params_returned:
+                res.update(state.result_in_params_returned)
         return res
 
     def _validate_flow_docarray_compatibility(self):
@@ -1,7 +1,12 @@
 import asyncio
 import copy
+import time
 from asyncio import Event, Task
+from collections import deque
 from typing import Callable, Dict, List, Optional, TYPE_CHECKING, Union
+
+import numpy as np
+
 from jina._docarray import docarray_v2
 
 if not docarray_v2:
@@ -13,6 +18,116 @@ from jina.types.request.data import DataRequest
 if TYPE_CHECKING:
     from jina._docarray import DocumentArray
 
+_STACKABLE_FIELDS = ('embedding', 'tensor')
+
+
+def _stack_tensor_fields(docs: 'DocumentArray') -> Dict[str, np.ndarray]:
+    """Copy the `embedding` and `tensor` fields of the docs into one contiguous buffer per field, and make every
+    Document hold a row view of that buffer.
+
+    A field is only stacked if every Document holds a numpy array of the same shape and dtype for it, otherwise
+    it is left untouched.
+
+    :param docs: the Documents of one batch
+    :return: a dict mapping every stacked field to its contiguous buffer
+    """
+    stacked = {}
+    if len(docs) == 0:
+        return stacked
+    for field in _STACKABLE_FIELDS:
+        arrays = [getattr(doc, field, None) for doc in docs]
+        first = arrays[0]
+        if not isinstance(first, np.ndarray) or any(
+                not isinstance(array, np.ndarray)
+                or array.shape != first.shape
+                or array.dtype != first.dtype
+                for array in arrays
+        ):
+            continue
+        buffer = np.empty((len(arrays),) + first.shape, dtype=first.dtype)
+        np.stack(arrays, out=buffer)
+        for i, doc in enumerate(docs):
+            setattr(doc, field, buffer[i])
+        stacked[field] = buffer
+    return stacked
+
+
+class _AdaptiveBatchingPolicy:
+    """Tunes the effective batch size and flush deadline of a :class:`BatchQueue` online, towards a p99 latency target.
+
+    The policy keeps a window of the observed execution time per Document and an exponentially weighted average of the
+    arrival rate. At most half of the latency target is spent executing a batch, the rest of the budget is the time a
+    request may wait for its batch to fill up. The static `preferred_batch_size` and `timeout` act as upper bounds.
+
+    :param latency_slo: target p99 latency of a request in milliseconds
+    :param max_batch_size: upper bound of the effective batch size, no bound if None
+    :param max_timeout: upper bound of the flush deadline in milliseconds
+    :param window_size: number of batches whose execution time is considered
+    :param smoothing: smoothing factor of the arrival rate average
+    """
+
+    def __init__(
+            self,
+            latency_slo: float,
+            max_batch_size: Optional[int],
+            max_timeout: float,
+            window_size: int = 100,
+            smoothing: float = 0.2,
+    ):
+        self._latency_slo = latency_slo / 1000
+        self._max_batch_size = max_batch_size
+        self._max_timeout = max_timeout / 1000
+        self._smoothing = smoothing
+        self._exec_time_per_doc = deque(maxlen=window_size)
+        self._arrival_rate: Optional[float] = None
+        self._last_arrival: Optional[float] = None
+        self.batch_size: Optional[int] = max_batch_size
+        self.timeout: float = max_timeout
+
+    def record_arrival(self, num_docs: int):
+        """Record the arrival of a request to update the arrival rate.
+
+        :param num_docs: number of Documents in the request
+        """
+        now = time.perf_counter()
+        if self._last_arrival is not None:
+            rate = num_docs / max(now - self._last_arrival, 1e-6)
+            if self._arrival_rate is None:
+                self._arrival_rate = rate
+            else:
+                self._arrival_rate = (
+                        self._smoothing * rate
+                        + (1 - self._smoothing) * self._arrival_rate
+                )
+        self._last_arrival = now
+
+    def record_batch(self, num_docs: int, exec_time: float):
+        """Record the execution of a batch and update the batch size and the flush deadline.
+
+        :param num_docs: number of Documents in the batch
+        :param exec_time: time in seconds it took to execute the batch
+        """
+        if num_docs == 0:
+            return
+        self._exec_time_per_doc.append(exec_time / num_docs)
+        self._update()
+
+    def _update(self):
+        exec_times = sorted(self._exec_time_per_doc)
+        p99_per_doc = exec_times[int(0.99 * (len(exec_times) - 1))]
+        if p99_per_doc > 0:
+            batch_size = max(int(self._latency_slo / 2 / p99_per_doc), 1)
+        else:
+            batch_size = self._max_batch_size
+        if self._max_batch_size is not None:
+            batch_size = min(batch_size, self._max_batch_size)
+        timeout = self._latency_slo - p99_per_doc * batch_size
+        if self._arrival_rate:
+            # waiting longer than it takes to fill the batch only adds latency
+            timeout = min(timeout, batch_size / self._arrival_rate)
+        self.batch_size = batch_size
+        self.timeout = min(max(timeout, 0), self._max_timeout) * 1000
+
 
 class BatchQueue:
     """A batch queue that holds the data request and the callable to batch requests to."""
@@ -29,6 +144,10 @@ class BatchQueue:
             timeout: int = 10_000,
             custom_metric: Optional[Callable[['DocumentArray'], Union[int, float]]] = None,
             use_custom_metric: bool = False,
+            stack_tensors: bool = False,
+            latency_slo: Optional[float] = None,
+            max_inflight_batches: Optional[int] = None,
+            inflight_semaphore: Optional[asyncio.Semaphore] = None,
             **kwargs,
     ) -> None:
         # To keep old user behavior, we use data lock when flush_all is true and no allow_concurrent
@@ -45,6 +164,25 @@ class BatchQueue:
         self._custom_metric = None if not use_custom_metric else custom_metric
         self._metric_value = 0
         self._timeout: int = timeout
+        self._stack_tensors = stack_tensors
+        self._policy: Optional[_AdaptiveBatchingPolicy] = None
+        if latency_slo is not None and self._custom_metric is None:
+            self._policy = _AdaptiveBatchingPolicy(
+                latency_slo=latency_slo,
+                max_batch_size=preferred_batch_size,
+                max_timeout=timeout,
+            )
+        # batches of the same endpoint can share the semaphore bounding how many of them are executed at the same time
+        self._inflight_semaphore = inflight_semaphore
+        if self._inflight_semaphore is None and max_inflight_batches:
+            self._inflight_semaphore = asyncio.Semaphore(max_inflight_batches)
+        self._max_pending_docs: Optional[int] = None
+        self._pending_docs = 0
+        self._pending_docs_condition: Optional[asyncio.Condition] = None
+        if max_inflight_batches and preferred_batch_size:
+            # the executed batches plus the one being accumulated
+            self._max_pending_docs = preferred_batch_size * (max_inflight_batches + 1)
+            self._pending_docs_condition = asyncio.Condition()
         self._reset()
         self._flush_trigger: Event = Event()
         self._timer_started, self._timer_finished = False, False
@@ -56,6 +194,25 @@ class BatchQueue:
     def __str__(self) -> str:
         return self.__repr__()
 
+    @property
+    def policy(self) -> Optional[_AdaptiveBatchingPolicy]:
+        """The adaptive batching policy of the queue, None if the batch size and timeout are static.
+
+        .. # noqa: DAR201"""
+        return self._policy
+
+    @property
+    def _effective_batch_size(self) -> Optional[int]:
+        if self._policy is not None:
+            return self._policy.batch_size
+        return self._preferred_batch_size
+
+    @property
+    def _effective_timeout(self) -> float:
+        if self._policy is not None:
+            return self._policy.timeout
+        return self._timeout
+
     def _reset(self) -> None:
         """Set all events and reset the batch queue."""
         self._requests: List[DataRequest] = []
@@ -89,7 +246,7 @@ class BatchQueue:
     async def _sleep_then_set(self):
         """Sleep and then set the event"""
         self._timer_finished = False
-        await asyncio.sleep(self._timeout / 1000)
+        await asyncio.sleep(self._effective_timeout / 1000)
         self._flush_trigger.set()
         self._timer_finished = True
 
@@ -105,6 +262,10 @@ class BatchQueue:
         :return: The queue that will receive when the request is processed.
         """
         docs = request.docs
+        if self._pending_docs_condition is not None:
+            await self._acquire_pending_docs(len(docs))
+        if self._policy is not None:
+            self._policy.record_arrival(len(docs))
 
         if not self._timer_task or self._timer_finished:
             # If there is no timer (first arrival), or the timer is already consumed, any new push should trigger a new Timer, before
@@ -127,11 +288,49 @@ class BatchQueue:
         self._requests.append(request)
         queue = asyncio.Queue()
         self._requests_completed.append(queue)
-        if self._metric_value >= self._preferred_batch_size:
+        if self._metric_value >= self._effective_batch_size:
             self._flush_trigger.set()
 
         return queue
 
+    async def _acquire_pending_docs(self, num_docs: int):
+        """Wait until the pending Documents leave room for `num_docs` more. A request is always admitted when nothing is pending.
+
+        :param num_docs: number of Documents of the request to admit
+        """
+        async with self._pending_docs_condition:
+            await self._pending_docs_condition.wait_for(
+                lambda: self._pending_docs == 0
+                        or self._pending_docs + num_docs <= self._max_pending_docs
+            )
+            self._pending_docs += num_docs
+
+    async def _release_pending_docs(self, num_docs: int):
+        async with self._pending_docs_condition:
+            self._pending_docs -= num_docs
+            self._pending_docs_condition.notify_all()
+
+    async def _execute_batch(self, docs: 'DocumentArray', semaphore: asyncio.Semaphore):
+        """Execute the function on one batch of Documents, once the semaphore admits it.
+
+        :param docs: the Documents of the batch
+        :param semaphore: semaphore bounding the batches executed at the same time
+        :return: the result of the function
+        """
+        async with semaphore:
+            if self._stack_tensors:
+                _stack_tensor_fields(docs)
+            start_time = time.perf_counter()
+            batch_res_docs = await self.func(
+                docs=docs,
+                parameters=self.params,
+                docs_matrix=None,  # joining manually with batch queue is not supported right now
+                tracing_context=None,
+            )
+            if self._policy is not None:
+                self._policy.record_batch(len(docs), time.perf_counter() - start_time)
+            return batch_res_docs
+
     async def _await_then_flush(self, http=False) -> None:
         """Process all requests in the queue once flush_trigger event is set.
         :param http: Flag to determine if the request is served via HTTP for some optims
@@ -277,64 +476,90 @@ class BatchQueue:
         # requests_idxs_in_batch with its lengths stored in requests_lens_in_batch. For each requests, there is a queue to
         # communicate that the request has been processed properly.
 
-        if not docarray_v2:
-            non_assigned_to_response_docs: DocumentArray = DocumentArray.empty()
-        else:
-            non_assigned_to_response_docs = self._response_docarray_cls()
-
-        non_assigned_to_response_request_idxs = []
-        sum_from_previous_first_req_idx = 0
-        for docs_inner_batch, req_idxs in batch(
-                big_doc_in_batch, requests_idxs_in_batch,
-                self._preferred_batch_size if not self._flush_all else None,
-                docs_metrics_in_batch if self._custom_metric is not None else None
-        ):
-            involved_requests_min_indx = req_idxs[0]
-            involved_requests_max_indx = req_idxs[-1]
-            input_len_before_call: int = len(docs_inner_batch)
-            batch_res_docs = None
-            try:
-                batch_res_docs = await self.func(
-                    docs=docs_inner_batch,
-                    parameters=self.params,
-                    docs_matrix=None,  # joining manually with batch queue is not supported right now
-                    tracing_context=None,
+        try:
+            if not docarray_v2:
+                non_assigned_to_response_docs: DocumentArray = DocumentArray.empty()
+            else:
+                non_assigned_to_response_docs = self._response_docarray_cls()
+
+            non_assigned_to_response_request_idxs = []
+            sum_from_previous_first_req_idx = 0
+            # Every batch is scheduled right away and the semaphore bounds how many of them are executed at the same time.
+            # Results are still validated and assigned to their requests in order, while the next batches execute.
+            semaphore = self._inflight_semaphore or asyncio.Semaphore(1)
+            scheduled_batches = [
+                (
+                    docs_inner_batch,
+                    req_idxs,
+                    asyncio.create_task(self._execute_batch(docs_inner_batch, semaphore)),
+                )
+                for docs_inner_batch, req_idxs in batch(
+                    big_doc_in_batch, requests_idxs_in_batch,
+                    self._effective_batch_size if not self._flush_all else None,
+                    docs_metrics_in_batch if self._custom_metric is not None else None
                 )
-                # Output validation
-                if (docarray_v2 and isinstance(batch_res_docs, DocList)) or (
-                        not docarray_v2
-                        and isinstance(batch_res_docs, DocumentArray)
-                ):
-                    if not len(batch_res_docs) == input_len_before_call:
-                        raise ValueError(
-                            f'Dynamic Batching requires input size to equal output size. Expected output size {input_len_before_call}, but got {len(batch_res_docs)}'
+            ]
+            for docs_inner_batch, req_idxs, batch_execution in scheduled_batches:
+                involved_requests_min_indx = req_idxs[0]
+                involved_requests_max_indx = req_idxs[-1]
+                input_len_before_call: int = len(docs_inner_batch)
+                batch_res_docs = None
+                try:
+                    batch_res_docs = await batch_execution
+                    # Output validation
+                    if (docarray_v2 and isinstance(batch_res_docs, DocList)) or (
+                            not docarray_v2
+                            and isinstance(batch_res_docs, DocumentArray)
+                    ):
+                        if not len(batch_res_docs) == input_len_before_call:
+                            raise ValueError(
+                                f'Dynamic Batching requires input size to equal output size. Expected output size {input_len_before_call}, but got {len(batch_res_docs)}'
+                            )
+                    elif batch_res_docs is None:
+                        if not len(docs_inner_batch) == input_len_before_call:
+                            raise ValueError(
+                                f'Dynamic Batching requires input size to equal output size. Expected output size {input_len_before_call}, but got {len(docs_inner_batch)}'
+                            )
+                    else:
+                        array_name = (
+                            'DocumentArray' if not docarray_v2 else 'DocList'
                         )
-                elif batch_res_docs is None:
-                    if not len(docs_inner_batch) == input_len_before_call:
-                        raise ValueError(
-                            f'Dynamic Batching requires input size to equal output size. Expected output size {input_len_before_call}, but got {len(docs_inner_batch)}'
+                        raise TypeError(
+                            f'The return type must be {array_name} / `None` when using dynamic batching, '
+                            f'but getting {batch_res_docs!r}'
                         )
+                except Exception as exc:
+                    # All the requests containing docs in this Exception should be raising it
+                    for request_full in requests_completed_in_batch[
+                                        involved_requests_min_indx: involved_requests_max_indx + 1
+                                        ]:
+                        await request_full.put(exc)
                 else:
-                    array_name = (
-                        'DocumentArray' if not docarray_v2 else 'DocList'
+                    # We need to attribute the docs to their requests
+                    non_assigned_to_response_docs.extend(
+                        batch_res_docs or docs_inner_batch
                     )
-                    raise TypeError(
-                        f'The return type must be {array_name} / `None` when using dynamic batching, '
-                        f'but getting {batch_res_docs!r}'
+                    non_assigned_to_response_request_idxs.extend(req_idxs)
+                    num_assigned_docs = await _assign_results(
+                        non_assigned_to_response_docs,
+                        non_assigned_to_response_request_idxs,
+                        sum_from_previous_first_req_idx,
+                        requests_lens_in_batch,
+                        requests_in_batch,
+                        requests_completed_in_batch,
                     )
-            except Exception as exc:
-                # All the requests containing docs in this Exception should be raising it
-                for request_full in requests_completed_in_batch[
-                                    involved_requests_min_indx: involved_requests_max_indx + 1
-                                    ]:
-                    await request_full.put(exc)
-            else:
-                # We need to attribute the docs to their requests
-                non_assigned_to_response_docs.extend(
-                    batch_res_docs or docs_inner_batch
-                )
-                non_assigned_to_response_request_idxs.extend(req_idxs)
-                num_assigned_docs = await _assign_results(
+
+                    sum_from_previous_first_req_idx = (
+                            len(non_assigned_to_response_docs) - num_assigned_docs
+                    )
+                    non_assigned_to_response_docs = non_assigned_to_response_docs[
+                                                    num_assigned_docs:
+                                                    ]
+                    non_assigned_to_response_request_idxs = (
+                        non_assigned_to_response_request_idxs[num_assigned_docs:]
+                    )
+            if len(non_assigned_to_response_request_idxs) > 0:
+                _ = await _assign_results(
                     non_assigned_to_response_docs,
                     non_assigned_to_response_request_idxs,
                     sum_from_previous_first_req_idx,
@@ -342,25 +567,9 @@ class BatchQueue:
                     requests_in_batch,
                     requests_completed_in_batch,
                 )
-
-                sum_from_previous_first_req_idx = (
-                        len(non_assigned_to_response_docs) - num_assigned_docs
-                )
-                non_assigned_to_response_docs = non_assigned_to_response_docs[
-                                                num_assigned_docs:
-                                                ]
-                non_assigned_to_response_request_idxs = (
-                    non_assigned_to_response_request_idxs[num_assigned_docs:]
-                )
-        if len(non_assigned_to_response_request_idxs) > 0:
-            _ = await _assign_results(
-                non_assigned_to_response_docs,
-                non_assigned_to_response_request_idxs,
-                sum_from_previous_first_req_idx,
-                requests_lens_in_batch,
-                requests_in_batch,
-                requests_completed_in_batch,
-            )
+        finally:
+            if self._pending_docs_condition is not None:
+                await self._release_pending_docs(len(big_doc_in_batch))
 
     async def close(self):
         """Closes the batch queue by flushing pending requests."""
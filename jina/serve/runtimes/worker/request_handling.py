@@ -153,6 +153,8 @@ class WorkerRequestHandler:
         self._batchqueue_config: Dict[str, Dict] = {}
         # the below is of "shape" exec_endpoint_name -> parameters_key -> batch_queue
         self._batchqueue_instances: Dict[str, Dict[str, BatchQueue]] = {}
+        # the below is of "shape" exec_endpoint_name -> semaphore bounding the batches executed at the same time
+        self._batchqueue_semaphores: Dict[str, asyncio.Semaphore] = {}
         self._init_batchqueue_dict()
         self._snapshot = None
         self._did_snapshot_raise_exception = None
@@ -328,7 +330,7 @@ class WorkerRequestHandler:
                 required=True,
                 help_text='You need to install the `prometheus_client` to use the montitoring functionality of jina',
             ):
-                from prometheus_client import Counter, Summary
+                from prometheus_client import Counter, Gauge, Summary
 
                 from jina.serve.monitoring import _SummaryDeprecated
 
@@ -356,10 +358,28 @@ class WorkerRequestHandler:
                     labelnames=('executor_endpoint', 'executor', 'runtime_name'),
                     registry=metrics_registry,
                 )
+
+                self._dynamic_batching_batch_size_metrics = Gauge(
+                    'dynamic_batching_batch_size',
+                    'Effective batch size chosen by the adaptive dynamic batching policy',
+                    namespace='jina',
+                    labelnames=('executor_endpoint', 'executor', 'runtime_name'),
+                    registry=metrics_registry,
+                )
+
+                self._dynamic_batching_timeout_metrics = Gauge(
+                    'dynamic_batching_timeout_seconds',
+                    'Effective flush timeout chosen by the adaptive dynamic batching policy',
+                    namespace='jina',
+                    labelnames=('executor_endpoint', 'executor', 'runtime_name'),
+                    registry=metrics_registry,
+                )
         else:
             self._document_processed_metrics = None
             self._request_size_metrics = None
             self._sent_response_size_metrics = None
+            self._dynamic_batching_batch_size_metrics = None
+            self._dynamic_batching_timeout_metrics = None
 
         if meter:
             self._document_processed_counter = meter.create_counter(
@@ -376,11 +396,68 @@ class WorkerRequestHandler:
                 name='jina_sent_response_bytes',
                 description='The size in bytes of the response sent to the gateway',
             )
+
+            meter.create_observable_gauge(
+                name='jina_dynamic_batching_batch_size',
+                callbacks=[
+                    self._dynamic_batching_observer(lambda policy: policy.batch_size)
+                ],
+                description='Effective batch size chosen by the adaptive dynamic batching policy',
+            )
+
+            meter.create_observable_gauge(
+                name='jina_dynamic_batching_timeout_seconds',
+                callbacks=[
+                    self._dynamic_batching_observer(
+                        lambda policy: policy.timeout / 1000
+                    )
+                ],
+                description='Effective flush timeout chosen by the adaptive dynamic batching policy',
+            )
         else:
             self._document_processed_counter = None
             self._request_size_histogram = None
             self._sent_response_size_histogram = None
 
+    def _dynamic_batching_observer(self, get_value):
+        from opentelemetry.metrics import Observation
+
+        def _observe(options):
+            for endpoint, param_to_queue in getattr(
+                self, '_batchqueue_instances', {}
+            ).items():
+                for batch_queue in param_to_queue.values():
+                    if batch_queue.policy is not None:
+                        yield Observation(
+                            get_value(batch_queue.policy),
+                            attributes=WorkerRequestHandler._metric_attributes(
+                                endpoint,
+                                self._executor.__class__.__name__,
+                                self.args.name,
+                            ),
+                        )
+
+        return _observe
+
+    def _record_dynamic_batching_monitoring(
+        self, exec_endpoint: str, batch_queue: BatchQueue
+    ):
+        if batch_queue.policy is None:
+            return
+        policy = batch_queue.policy
+        if self._dynamic_batching_batch_size_metrics:
+            self._dynamic_batching_batch_size_metrics.labels(
+                exec_endpoint,
+                self._executor.__class__.__name__,
+                self.args.name,
+            ).set_function(lambda: policy.batch_size)
+        if self._dynamic_batching_timeout_metrics:
+            self._dynamic_batching_timeout_metrics.labels(
+                exec_endpoint,
+                self._executor.__class__.__name__,
+                self.args.name,
+            ).set_function(lambda: policy.timeout / 1000)
+
     def _load_executor(
         self,
         metrics_registry: Optional['CollectorRegistry'] = None,
@@ -412,6 +489,8 @@ class WorkerRequestHandler:
                     'tracer_provider': tracer_provider,
                     'meter_provider': meter_provider,
                     'allow_concurrent': self.args.allow_concurrent,
+                    'execution_model': self.args.execution_model,
+                    'endpoint_concurrency': self.args.endpoint_concurrency,
                 },
                 py_modules=self.args.py_modules,
                 extra_search_paths=self.args.extra_search_paths,
@@ -489,6 +568,7 @@ class WorkerRequestHandler:
         self._executor.requests.clear()
         requests = {k: v.__name__ for k, v in requests.items()}
         self._executor._add_requests(requests)
+        self._executor._build_dispatch_plans()
 
     @staticmethod
     def _parse_params(parameters: Union[Dict, Struct], executor_name: str):
@@ -704,6 +784,16 @@ class WorkerRequestHandler:
 
             param_key = json.dumps(params, sort_keys=True)
             if param_key not in self._batchqueue_instances[exec_endpoint]:
+                max_inflight_batches = self._batchqueue_config[exec_endpoint].get(
+                    'max_inflight_batches', None
+                )
+                if (
+                    max_inflight_batches
+                    and exec_endpoint not in self._batchqueue_semaphores
+                ):
+                    self._batchqueue_semaphores[exec_endpoint] = asyncio.Semaphore(
+                        max_inflight_batches
+                    )
                 self._batchqueue_instances[exec_endpoint][param_key] = BatchQueue(
                     functools.partial(self._executor.__acall__, exec_endpoint),
                     request_docarray_cls=self._executor.requests[
@@ -714,8 +804,13 @@ class WorkerRequestHandler:
                     ].response_schema,
                     output_array_type=self.args.output_array_type,
                     params=params,
+                    inflight_semaphore=self._batchqueue_semaphores.get(exec_endpoint),
                     **self._batchqueue_config[exec_endpoint],
                 )
+                self._record_dynamic_batching_monitoring(
+                    exec_endpoint,
+                    self._batchqueue_instances[exec_endpoint][param_key],
+                )
             # This is necessary because push might need to await for the queue to be emptied
             # the batch queue will change the request in-place
             queue = await self._batchqueue_instances[exec_endpoint][param_key].push(
@@ -797,6 +892,7 @@ class WorkerRequestHandler:
             self.logger.debug(f'Await closing all the batching queues')
             await asyncio.gather(*[q.close() for q in self._all_batch_queues()])
             self._executor.close()
+            self._executor._close_endpoint_pools()
             self._is_closed = True
         self.logger.debug(f'Request Handler closed')
 
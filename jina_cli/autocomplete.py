@@ -44,6 +44,8 @@ ac_table = {
             '--no-reduce',
             '--disable-reduce',
             '--allow-concurrent',
+            '--execution-model',
+            '--endpoint-concurrency',
             '--grpc-server-options',
             '--raft-configuration',
             '--grpc-channel-options',
@@ -412,6 +414,8 @@ ac_table = {
             '--no-reduce',
             '--disable-reduce',
             '--allow-concurrent',
+            '--execution-model',
+            '--endpoint-concurrency',
             '--grpc-server-options',
             '--raft-configuration',
             '--grpc-channel-options',
@@ -487,6 +491,8 @@ ac_table = {
             '--no-reduce',
             '--disable-reduce',
             '--allow-concurrent',
+            '--execution-model',
+            '--endpoint-concurrency',
             '--grpc-server-options',
             '--raft-configuration',
             '--grpc-channel-options',
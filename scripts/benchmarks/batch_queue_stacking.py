@@ -0,0 +1,78 @@
+"""Compare the default BatchQueue path with `stack_tensors=True` on embedding-heavy requests.
+
+Usage: python scripts/benchmarks/batch_queue_stacking.py --requests 512 --docs 8 --dim 768
+"""
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from jina import Document, DocumentArray
+from jina.serve.runtimes.worker.batch_queue import BatchQueue
+from jina.types.request.data import DataRequest
+
+
+def _build_requests(num_requests, num_docs, dim):
+    requests = []
+    for _ in range(num_requests):
+        req = DataRequest()
+        req.data.docs = DocumentArray(
+            [
+                Document(embedding=np.random.rand(dim).astype(np.float32))
+                for _ in range(num_docs)
+            ]
+        )
+        requests.append(DataRequest(req.proto.SerializeToString()))
+    return requests
+
+
+async def _run(stack_tensors, requests, batch_size, dim):
+    weights = np.random.rand(dim, dim).astype(np.float32)
+
+    async def encode(docs, **kwargs):
+        docs.embeddings = docs.embeddings @ weights
+
+    bq = BatchQueue(
+        encode,
+        request_docarray_cls=DocumentArray,
+        response_docarray_cls=DocumentArray,
+        preferred_batch_size=batch_size,
+        timeout=5,
+        stack_tensors=stack_tensors,
+    )
+
+    async def process(req):
+        q = await bq.push(req)
+        item = await q.get()
+        q.task_done()
+        if isinstance(item, Exception):
+            raise item
+        return req.SerializeToString()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[process(req) for req in requests])
+    elapsed = time.perf_counter() - start
+    await bq.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=512)
+    parser.add_argument('--docs', type=int, default=8)
+    parser.add_argument('--dim', type=int, default=768)
+    parser.add_argument('--batch-size', type=int, default=64)
+    args = parser.parse_args()
+
+    for stack_tensors in (False, True):
+        requests = _build_requests(args.requests, args.docs, args.dim)
+        elapsed = asyncio.run(_run(stack_tensors, requests, args.batch_size, args.dim))
+        print(
+            f'stack_tensors={stack_tensors}: {elapsed:.3f}s, '
+            f'{args.requests * args.docs / elapsed:.0f} docs/s'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Measure the per-call overhead of dispatching a small request to an Executor endpoint.
+
+Run it on two revisions to compare them, e.g. before and after a change to `BaseExecutor.__acall_endpoint__`.
+
+Usage: python scripts/benchmarks/executor_dispatch.py --calls 20000
+"""
+import argparse
+import asyncio
+import time
+
+from jina import Document, DocumentArray, Executor, requests
+
+
+class SyncExecutor(Executor):
+    @requests(on='/sync')
+    def foo(self, docs, **kwargs):
+        pass
+
+
+class AsyncExecutor(Executor):
+    @requests(on='/async')
+    async def foo(self, docs, **kwargs):
+        pass
+
+
+async def _run(executor, endpoint, calls):
+    docs = DocumentArray([Document(text='hello')])
+    for _ in range(100):
+        await executor.__acall__(endpoint, docs=docs, tracing_context=None)
+    start = time.perf_counter()
+    for _ in range(calls):
+        await executor.__acall__(endpoint, docs=docs, tracing_context=None)
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', type=int, default=20000)
+    args = parser.parse_args()
+
+    for executor, endpoint in ((SyncExecutor(), '/sync'), (AsyncExecutor(), '/async')):
+        per_call = asyncio.run(_run(executor, endpoint, args.calls))
+        print(f'{endpoint}: {per_call * 1e6:.1f}us per call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Measure the gateway requests/s against the number of Deployments in a linear Flow.
+
+Executors are replaced by an in-process connection pool that answers immediately, so that only the gateway cost of
+routing a request through the TopologyGraph is measured.
+
+Usage: python scripts/benchmarks/gateway_topology_graph.py --requests 2000 --sizes 1 5 10 20
+"""
+import argparse
+import asyncio
+import time
+
+from jina import Document, DocumentArray
+from jina.serve.networking import default_endpoints_proto
+from jina.serve.runtimes.gateway.async_request_response_handling import (
+    AsyncRequestResponseHandler,
+)
+from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
+from jina.types.request.data import DataRequest
+
+
+class _InstantConnectionPool:
+    async def send_discover_endpoint(self, *args, **kwargs):
+        return default_endpoints_proto, None
+
+    async def send_requests_once(self, requests, *args, **kwargs):
+        return requests[0], {}
+
+
+def _linear_graph(num_deployments):
+    names = [f'deployment{i}' for i in range(num_deployments)]
+    graph = {'start-gateway': [names[0]]}
+    for name, next_name in zip(names, names[1:] + ['end-gateway']):
+        graph[name] = [next_name]
+    return graph
+
+
+def _build_request():
+    req = DataRequest()
+    req.header.exec_endpoint = '/'
+    req.data.docs = DocumentArray([Document(text='hello') for _ in range(8)])
+    return req
+
+
+async def _run(num_deployments, num_requests):
+    graph = TopologyGraph(
+        _linear_graph(num_deployments),
+        deployments_metadata={
+            f'deployment{i}': {'key': 'value'} for i in range(num_deployments)
+        },
+    )
+    handler = AsyncRequestResponseHandler()
+    handle = handler.handle_request(graph, _InstantConnectionPool())
+
+    async def send():
+        future, _ = handle(_build_request(), DocumentArray)
+        await future
+
+    await asyncio.gather(*[send() for _ in range(100)])
+    start = time.perf_counter()
+    await asyncio.gather(*[send() for _ in range(num_requests)])
+    return num_requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 5, 10, 20])
+    args = parser.parse_args()
+
+    for num_deployments in args.sizes:
+        rps = asyncio.run(_run(num_deployments, args.requests))
+        print(f'{num_deployments} deployments: {rps:.0f} requests/s')
+
+
+if __name__ == '__main__':
+    main()
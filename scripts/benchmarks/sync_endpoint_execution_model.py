@@ -0,0 +1,58 @@
+"""Compare the execution models of a CPU-bound, pure-Python synchronous endpoint under concurrent requests.
+
+Usage: python scripts/benchmarks/sync_endpoint_execution_model.py --requests 32 --concurrency 4
+"""
+import argparse
+import asyncio
+import time
+
+from jina import Document, DocumentArray, Executor, requests
+
+
+class CPUBoundExecutor(Executor):
+    @requests(on='/work')
+    def work(self, docs, **kwargs):
+        for doc in docs:
+            doc.tags['sum'] = sum(i * i for i in range(200_000))
+
+
+async def _send(executor, num_requests):
+    await asyncio.gather(
+        *[
+            executor.__acall__(
+                '/work', docs=DocumentArray([Document()]), tracing_context=None
+            )
+            for _ in range(num_requests)
+        ]
+    )
+
+
+async def _run(executor, num_requests, concurrency):
+    await _send(executor, concurrency)  # warm up the pools
+    start = time.perf_counter()
+    await _send(executor, num_requests)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=32)
+    parser.add_argument('--concurrency', type=int, default=4)
+    args = parser.parse_args()
+
+    for execution_model in ('DEFAULT', 'THREAD', 'PROCESS'):
+        executor = CPUBoundExecutor(
+            runtime_args={
+                'execution_model': execution_model,
+                'endpoint_concurrency': {'*': args.concurrency},
+            }
+        )
+        elapsed = asyncio.run(_run(executor, args.requests, args.concurrency))
+        executor._close_endpoint_pools()
+        print(
+            f'{execution_model}: {elapsed:.3f}s, {args.requests / elapsed:.1f} requests/s'
+        )
+
+
+if __name__ == '__main__':
+    main()
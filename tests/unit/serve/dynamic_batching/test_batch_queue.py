@@ -353,3 +353,174 @@ async def test_return_proper_assignment(num_requests, preferred_batch_size, time
         assert len(resp.docs) == length
         for j, d in enumerate(resp.docs):
             assert d.text == f'Text {j} from request {i} with len {length} Processed'
+
+
+@pytest.mark.parametrize('stack_tensors', [False, True])
+@pytest.mark.asyncio
+async def test_stack_tensors(stack_tensors):
+    import numpy as np
+
+    async def foo(docs, **kwargs):
+        embeddings = docs.embeddings
+        if stack_tensors:
+            assert all(doc.embedding.base is docs[0].embedding.base for doc in docs)
+        docs.embeddings = embeddings * 2
+
+    bq: BatchQueue = BatchQueue(
+        foo,
+        request_docarray_cls=DocumentArray,
+        response_docarray_cls=DocumentArray,
+        preferred_batch_size=8,
+        timeout=500,
+        stack_tensors=stack_tensors,
+    )
+
+    data_requests = [DataRequest() for _ in range(5)]
+    for i, req in enumerate(data_requests):
+        req.data.docs = DocumentArray(
+            [Document(embedding=np.full(16, i * 10 + j, dtype=np.float32)) for j in range(3)]
+        )
+
+    async def process_request(req):
+        q = await bq.push(req)
+        item = await q.get()
+        q.task_done()
+        return item
+
+    tasks = [asyncio.create_task(process_request(req)) for req in data_requests]
+    items = await asyncio.gather(*tasks)
+    assert all(item is None for item in items)
+    for i, req in enumerate(data_requests):
+        assert len(req.docs) == 3
+        for j, doc in enumerate(req.docs):
+            np.testing.assert_equal(doc.embedding, np.full(16, (i * 10 + j) * 2))
+    await bq.close()
+
+
+def test_adaptive_batching_policy():
+    from jina.serve.runtimes.worker.batch_queue import _AdaptiveBatchingPolicy
+
+    policy = _AdaptiveBatchingPolicy(latency_slo=100, max_batch_size=64, max_timeout=1000)
+    assert policy.batch_size == 64
+    assert policy.timeout == 1000
+
+    # 10ms per doc: half of the 100ms budget fits 5 docs, the other half is left for waiting
+    policy.record_batch(num_docs=10, exec_time=0.1)
+    assert policy.batch_size == 5
+    assert policy.timeout == pytest.approx(50)
+
+    # fast executions are bounded by the static configuration
+    fast_policy = _AdaptiveBatchingPolicy(latency_slo=100, max_batch_size=64, max_timeout=20)
+    fast_policy.record_batch(num_docs=10, exec_time=0.00001)
+    assert fast_policy.batch_size == 64
+    assert fast_policy.timeout == pytest.approx(20)
+
+
+@pytest.mark.asyncio
+async def test_batch_queue_latency_slo():
+    async def foo(docs, **kwargs):
+        await asyncio.sleep(0.01 * len(docs))
+
+    bq: BatchQueue = BatchQueue(
+        foo,
+        request_docarray_cls=DocumentArray,
+        response_docarray_cls=DocumentArray,
+        preferred_batch_size=32,
+        timeout=2000,
+        latency_slo=200,
+    )
+    assert bq.policy is not None
+
+    async def process_request(req):
+        q = await bq.push(req)
+        item = await q.get()
+        q.task_done()
+        return item
+
+    for _ in range(3):
+        data_requests = [DataRequest() for _ in range(32)]
+        for req in data_requests:
+            req.data.docs = DocumentArray.empty(1)
+        await asyncio.gather(*[process_request(req) for req in data_requests])
+
+    assert bq.policy.batch_size < 32
+    assert bq.policy.timeout < 2000
+    await bq.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_queue_max_inflight_batches():
+    executing = 0
+    max_executing = 0
+
+    async def foo(docs, **kwargs):
+        nonlocal executing, max_executing
+        executing += 1
+        max_executing = max(max_executing, executing)
+        await asyncio.sleep(0.2)
+        executing -= 1
+        for doc in docs:
+            doc.text += ' Processed'
+
+    bq: BatchQueue = BatchQueue(
+        foo,
+        request_docarray_cls=DocumentArray,
+        response_docarray_cls=DocumentArray,
+        preferred_batch_size=2,
+        timeout=100,
+        max_inflight_batches=2,
+    )
+
+    data_requests = [DataRequest() for _ in range(12)]
+    for i, req in enumerate(data_requests):
+        req.data.docs = DocumentArray([Document(text=f'Text {i}')])
+
+    async def process_request(req):
+        q = await bq.push(req)
+        assert bq._pending_docs <= 6
+        item = await q.get()
+        q.task_done()
+        return item
+
+    items = await asyncio.gather(*[process_request(req) for req in data_requests])
+    assert all(item is None for item in items)
+    assert max_executing == 2
+    assert bq._pending_docs == 0
+    for i, req in enumerate(data_requests):
+        assert req.docs[0].text == f'Text {i} Processed'
+    await bq.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_queue_max_inflight_batches_exception():
+    async def foo(docs, **kwargs):
+        await asyncio.sleep(0.1)
+        if any(doc.text == 'fail' for doc in docs):
+            raise Exception('Raised exception')
+
+    bq: BatchQueue = BatchQueue(
+        foo,
+        request_docarray_cls=DocumentArray,
+        response_docarray_cls=DocumentArray,
+        preferred_batch_size=1,
+        timeout=100,
+        max_inflight_batches=4,
+    )
+
+    data_requests = [DataRequest() for _ in range(4)]
+    for i, req in enumerate(data_requests):
+        req.data.docs = DocumentArray([Document(text='fail' if i == 2 else 'ok')])
+
+    async def process_request(req):
+        q = await bq.push(req)
+        item = await q.get()
+        q.task_done()
+        return item
+
+    items = await asyncio.gather(*[process_request(req) for req in data_requests])
+    for i, item in enumerate(items):
+        if i == 2:
+            assert isinstance(item, Exception)
+        else:
+            assert item is None
+    await bq.close()
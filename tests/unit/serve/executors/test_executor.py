@@ -10,7 +10,7 @@ import yaml
 from docarray import Document, DocumentArray
 from pytest import FixtureRequest
 
-from jina import Client, Executor, Flow, dynamic_batching, requests
+from jina import Client, Deployment, Executor, Flow, dynamic_batching, requests
 from jina.clients.request import request_generator
 from jina.constants import __cache_path__
 from jina.excepts import RuntimeFailToStart
@@ -385,6 +385,102 @@ async def test_async():
     assert da1.texts == ['hello'] * N
 
 
+@pytest.mark.asyncio
+async def test_dispatch_plans():
+    class DispatchExecutor(Executor):
+        @requests(on='/foo')
+        def foo(self, docs: DocumentArray, **kwargs):
+            for d in docs:
+                d.text = 'foo'
+
+        def bar(self, docs: DocumentArray, **kwargs):
+            for d in docs:
+                d.text = 'bar'
+
+    exec = DispatchExecutor()
+    plan = exec._dispatch_plans['/foo']
+    da = DocumentArray.empty(2)
+    await exec.__acall__('/foo', docs=da, tracing_context=None)
+    assert da.texts == ['foo'] * 2
+    # the plan is built once and reused across calls
+    assert exec._dispatch_plans['/foo'] is plan
+
+    # replacing the endpoint function, like hot reload does, rebuilds the plan
+    exec._add_requests({'/foo': 'bar'})
+    await exec.__acall__('/foo', docs=da, tracing_context=None)
+    assert da.texts == ['bar'] * 2
+    assert exec._dispatch_plans['/foo'] is not plan
+
+
+class ConcurrentExecutor(Executor):
+    @requests(on='/sleep')
+    def sleep(self, docs: DocumentArray, **kwargs):
+        time.sleep(0.5)
+        for d in docs:
+            d.tags['pid'] = os.getpid()
+
+    @requests(on='/return-docs')
+    def return_docs(self, docs: DocumentArray, parameters, **kwargs):
+        return DocumentArray([Document(text=parameters['text']) for _ in docs])
+
+    @requests(on='/return-dict')
+    def return_dict(self, docs: DocumentArray, **kwargs):
+        for d in docs:
+            d.text = 'changed'
+        return {'pid': os.getpid()}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('execution_model', ['THREAD', 'PROCESS'])
+async def test_execution_model(execution_model):
+    exec = ConcurrentExecutor(
+        runtime_args={
+            'execution_model': execution_model,
+            'endpoint_concurrency': {'/sleep': 4},
+        }
+    )
+    try:
+        das = [DocumentArray.empty(1) for _ in range(4)]
+        start = time.time()
+        await asyncio.gather(
+            *[exec.__acall__('/sleep', docs=da, tracing_context=None) for da in das]
+        )
+        # the 4 calls run concurrently instead of one after the other
+        assert time.time() - start < 1.5
+        pids = {da[0].tags['pid'] for da in das}
+        if execution_model == 'PROCESS':
+            assert os.getpid() not in pids
+        else:
+            assert pids == {os.getpid()}
+
+        ret = await exec.__acall__(
+            '/return-docs',
+            docs=DocumentArray.empty(2),
+            parameters={'text': 'returned'},
+            tracing_context=None,
+        )
+        assert ret.texts == ['returned'] * 2
+
+        da = DocumentArray.empty(2)
+        ret = await exec.__acall__('/return-dict', docs=da, tracing_context=None)
+        assert da.texts == ['changed'] * 2
+        assert (ret['pid'] != os.getpid()) == (execution_model == 'PROCESS')
+    finally:
+        exec._close_endpoint_pools()
+
+
+def test_execution_model_in_deployment():
+    with Deployment(
+        uses=ConcurrentExecutor,
+        execution_model='PROCESS',
+        endpoint_concurrency={'*': 2},
+    ) as dep:
+        docs = dep.post(
+            on='/return-dict', inputs=DocumentArray.empty(2), request_size=1
+        )
+    assert docs.texts == ['changed'] * 2
+
+
 def set_hello(d: Document):
     d.text = 'hello'
     return d
@@ -614,15 +710,15 @@ def test_executors_inheritance_binding():
     [
         (
             dict(preferred_batch_size=4, timeout=5_000),
-            dict(preferred_batch_size=4, timeout=5_000, flush_all=False, use_custom_metric=False, custom_metric=None, use_dynamic_batching=True),
+            dict(preferred_batch_size=4, timeout=5_000, flush_all=False, use_custom_metric=False, custom_metric=None, use_dynamic_batching=True, stack_tensors=False, latency_slo=None, max_inflight_batches=None),
         ),
         (
             dict(preferred_batch_size=4, timeout=5_000, flush_all=True),
-            dict(preferred_batch_size=4, timeout=5_000, flush_all=True, use_custom_metric=False, custom_metric=None, use_dynamic_batching=True),
+            dict(preferred_batch_size=4, timeout=5_000, flush_all=True, use_custom_metric=False, custom_metric=None, use_dynamic_batching=True, stack_tensors=False, latency_slo=None, max_inflight_batches=None),
         ),
         (
             dict(preferred_batch_size=4),
-            dict(preferred_batch_size=4, timeout=10_000, flush_all=False, use_custom_metric=False, custom_metric=None, use_dynamic_batching=True),
+            dict(preferred_batch_size=4, timeout=10_000, flush_all=False, use_custom_metric=False, custom_metric=None, use_dynamic_batching=True, stack_tensors=False, latency_slo=None, max_inflight_batches=None),
         ),
     ],
 )
@@ -641,15 +737,15 @@ def test_dynamic_batching(inputs, expected_values):
     [
         (
             dict(preferred_batch_size=4, timeout=5_000),
-            dict(preferred_batch_size=4, timeout=5_000, flush_all=False, use_custom_metric=False, custom_metric=None, use_dynamic_batching=True),
+            dict(preferred_batch_size=4, timeout=5_000, flush_all=False, use_custom_metric=False, custom_metric=None, use_dynamic_batching=True, stack_tensors=False, latency_slo=None, max_inflight_batches=None),
         ),
         (
             dict(preferred_batch_size=4, timeout=5_000, flush_all=True),
-            dict(preferred_batch_size=4, timeout=5_000, flush_all=True, use_custom_metric=False, custom_metric=None, use_dynamic_batching=True),
+            dict(preferred_batch_size=4, timeout=5_000, flush_all=True, use_custom_metric=False, custom_metric=None, use_dynamic_batching=True, stack_tensors=False, latency_slo=None, max_inflight_batches=None),
         ),
         (
             dict(preferred_batch_size=4),
-            dict(preferred_batch_size=4, timeout=10_000, flush_all=False, use_custom_metric=False, custom_metric=None, use_dynamic_batching=True),
+            dict(preferred_batch_size=4, timeout=10_000, flush_all=False, use_custom_metric=False, custom_metric=None, use_dynamic_batching=True, stack_tensors=False, latency_slo=None, max_inflight_batches=None),
         ),
     ],
 )
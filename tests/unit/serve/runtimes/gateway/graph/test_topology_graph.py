@@ -598,13 +598,13 @@ class DummyMockGatewayRuntime:
         )
 
     async def receive_from_client(self, client_id, msg: 'DataRequest'):
-        graph = copy.deepcopy(self.graph)
-        # important that the gateway needs to have an instance of the graph per request
+        # the graph is shared by all the requests, each request has its own context
+        request_context = self.graph.create_request_context()
         tasks_to_respond = []
         tasks_to_ignore = []
-        for origin_node in graph.origin_nodes:
+        for origin_node in self.graph.origin_nodes:
             leaf_tasks = origin_node.get_leaf_req_response_tasks(
-                self.connection_pool, msg, None
+                self.connection_pool, msg, None, request_context=request_context
             )
             # Every origin node returns a set of tasks that are the ones corresponding to the leafs of each of their subtrees that unwrap all the previous tasks.
             # It starts like a chain of waiting for tasks from previous nodes
@@ -647,6 +647,43 @@ async def test_message_ordering_linear_graph(linear_graph_dict):
         )
 
 
+@pytest.mark.asyncio
+async def test_request_context_keeps_state_out_of_graph(linear_graph_dict):
+    graph = TopologyGraph(linear_graph_dict)
+    connection_pool = DummyMockConnectionPool()
+
+    async def send(text):
+        request_context = graph.create_request_context()
+        tasks = []
+        for origin_node in graph.origin_nodes:
+            tasks.extend(
+                task
+                for _, task in origin_node.get_leaf_req_response_tasks(
+                    connection_pool,
+                    create_req_from_text(text),
+                    None,
+                    request_context=request_context,
+                )
+            )
+        resp, _ = (await asyncio.gather(*tasks))[0]
+        return graph.add_routes(resp, request_context), request_context
+
+    (resp0, ctx0), (resp1, ctx1) = await asyncio.gather(
+        send('client0-Request'), send('client1-Request')
+    )
+    for resp in (resp0, resp1):
+        assert [r.executor for r in resp.routes] == [
+            f'deployment{i}' for i in range(4)
+        ]
+    for node in graph.all_nodes:
+        assert not hasattr(node, 'parts_to_send')
+    for i in range(4):
+        state0 = ctx0.get_node_state(f'deployment{i}')
+        state1 = ctx1.get_node_state(f'deployment{i}')
+        assert state0 is not state1
+        assert state0.start_time is not None and state0.parts_to_send == []
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     'conditions, node_skipped',